@@ -31,9 +31,26 @@ editorial_prompt = (
     """
 )
 
-def run_summary(transcript: str, models: list[str], max_retries: int = 3) -> str:
+follow_up_prompt = (
     """
-    Run summary with model fallback logic for handling API failures
+        🔁 Follow-up Story:
+        - The newsletter recently covered this story under the headlines below
+        - Keep the article **short** (2-3 paragraphs) and focus only on **what is new**
+        - Do not repeat background readers already got in the earlier coverage
+
+        Previously covered:
+    """
+)
+
+def run_summary(
+    transcript: str,
+    models: list[str],
+    max_retries: int = 3,
+    previous_coverage: list[str] | None = None
+) -> tuple[str, str]:
+    """
+    Run summary with model fallback logic for handling API failures.
+    Returns the article and the name of the model that produced it.
     """
     # If single model passed as string, convert to list for compatibility
     if isinstance(models, str):
@@ -45,9 +62,9 @@ def run_summary(transcript: str, models: list[str], max_retries: int = 3) -> str
         print(f"🔄 Trying model: {model_name}")
         
         try:
-            result = _try_model_with_retries(transcript, model_name, max_retries)
+            result = _try_model_with_retries(transcript, model_name, max_retries, previous_coverage)
             print(f"✅ Successfully used model: {model_name}")
-            return result
+            return result, model_name
             
         except Exception as e:
             last_error = e
@@ -60,10 +77,19 @@ def run_summary(transcript: str, models: list[str], max_retries: int = 3) -> str
     raise last_error
 
 
-def _try_model_with_retries(transcript: str, model_name: str, max_retries: int) -> str:
+def _try_model_with_retries(
+    transcript: str,
+    model_name: str,
+    max_retries: int,
+    previous_coverage: list[str] | None = None
+) -> str:
     """
     Try a single model with retry logic
     """
+    description = editorial_prompt
+    if previous_coverage:
+        description += follow_up_prompt + "\n".join(f"        - {title}" for title in previous_coverage)
+
     for attempt in range(max_retries):
         try:
             llm = LLM(
@@ -81,7 +107,7 @@ def _try_model_with_retries(transcript: str, model_name: str, max_retries: int)
             )
             
             task = Task(
-                description=f"{editorial_prompt}\n\nTranscript:\n{transcript}",
+                description=f"{description}\n\nTranscript:\n{transcript}",
                 expected_output="A well-formatted, email-friendly newsletter article without any promotional content.",
                 agent=editor_agent
             )
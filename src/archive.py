@@ -0,0 +1,75 @@
+import argparse
+import datetime
+import sqlite3
+import yaml
+
+from pathlib import Path
+from tools.article_archive import ArticleArchive
+from tools.text_utils import concatenate_text
+
+# MARK: Loading
+
+# Read the config directly rather than importing main, so lookups stay fast
+# without pulling in the CrewAI stack.
+project_root = Path(__file__).resolve().parent.parent
+
+yaml_path = project_root / "config" / "config.yaml"
+with open(yaml_path, "r") as f:
+    APP_CONFIG = yaml.safe_load(f)
+
+ARCHIVE_PATH = project_root / APP_CONFIG.get("archive", {}).get("path", "data/articles.db")
+
+# MARK: Commands
+
+def search_articles(archive: ArticleArchive, query: str, limit: int, raw: bool = False):
+    try:
+        rows = archive.search(query, limit=limit, raw=raw)
+    except sqlite3.OperationalError as e:
+        print(f"❌ Invalid FTS5 query '{query}': {e}")
+        print("💡 Tip: Drop --fts to search for the plain words instead")
+        return
+    print(f"🔍 {len(rows)} article(s) matching '{query}'")
+    for row in rows:
+        print(f"  • [{row['created_at']}] {row['title']} ({row['video_id']}, {row['channel_id'] or 'unknown channel'})")
+
+def rebuild_issue(archive: ArticleArchive, date: str, newsletter: str | None = None):
+    try:
+        start = datetime.datetime.strptime(date, "%Y-%m-%d")
+    except ValueError:
+        print(f"❌ Invalid date '{date}': expected YYYY-MM-DD, e.g. 2025-01-31")
+        return
+    issues = archive.get_issues(start, start + datetime.timedelta(days=1), newsletter)
+    if not issues:
+        print(f"⚠️ No issues sent on {date}" + (f" for '{newsletter}'" if newsletter else ""))
+        return
+    for issue in issues:
+        rows = archive.get_issue_articles(issue["id"])
+        print(f"📰 {issue['newsletter']} - sent {issue['sent_at']} ({len(rows)} articles)\n")
+        print(concatenate_text([row["body"] for row in rows]))
+
+# MARK: Entry point
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Search and rebuild archived newsletter articles.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    search_parser = subparsers.add_parser("search", help="Full-text search over archived articles")
+    search_parser.add_argument("query", help="Words that must all appear, e.g. 'U.S. election'")
+    search_parser.add_argument("--limit", type=int, default=10)
+    search_parser.add_argument("--fts", action="store_true", help="Treat the query as FTS5 syntax, e.g. 'budget OR tariffs'")
+
+    issue_parser = subparsers.add_parser("issue", help="Print the issues sent on a day as Markdown")
+    issue_parser.add_argument("date", help="Day in YYYY-MM-DD format")
+    issue_parser.add_argument("--newsletter", help="Only issues of this newsletter, e.g. 'TLDR News Global'")
+
+    args = parser.parse_args()
+
+    if not ARCHIVE_PATH.exists():
+        print(f"⚠️ No archive yet at {ARCHIVE_PATH} - it is created on the first newsletter run")
+        raise SystemExit(1)
+
+    with ArticleArchive(ARCHIVE_PATH) as archive:
+        if args.command == "search":
+            search_articles(archive, args.query, args.limit, args.fts)
+        else:
+            rebuild_issue(archive, args.date, args.newsletter)
@@ -4,6 +4,7 @@ import yaml
 
 from agents.transcript_to_article_agent import run_summary
 from dotenv import load_dotenv
+from tools.article_archive import ArticleArchive
 from tools.email_utils import send_email
 from tools.groq_tools import managed_groq
 from tools.rate_limiting import rate_limited_processing_delay
@@ -30,13 +31,18 @@ yaml_path = project_root / "config" / "config.yaml"
 with open(yaml_path, "r") as f:
     APP_CONFIG = yaml.safe_load(f)
 
+NEWSLETTER_NAME = "TLDR News Daily Summary"
+
+ARCHIVE_CONFIG = APP_CONFIG.get("archive", {})
+ARCHIVE_PATH = project_root / ARCHIVE_CONFIG.get("path", "data/articles.db")
+
 # MARK: Main pipeline
 
 def get_published_after_date(days: int, now: datetime.datetime | None = None) -> str:
     now = now or datetime.datetime.now()
     return (now - datetime.timedelta(days=days)).isoformat("T") + "Z"
 
-def get_video_ids(channel_ids: list[str], days_back: int) -> list[str]:
+def get_channel_video_ids(channel_ids: list[str], days_back: int) -> dict[str, list[str]]:
     print(f"\n🚀 STEP 1: Fetching video IDs from {len(channel_ids)} channels")
     print(f"📅 Looking for videos published in the last {days_back} day(s)")
     
@@ -44,32 +50,57 @@ def get_video_ids(channel_ids: list[str], days_back: int) -> list[str]:
         print("❌ No YouTube channel IDs provided in configuration")
         raise ValueError("No YouTube channel IDs provided.")
 
-    all_video_ids = []
+    channel_video_ids = {}
     published_after = get_published_after_date(days_back)
     
     for i, channel_id in enumerate(channel_ids, 1):
         print(f"\n📺 Processing channel {i}/{len(channel_ids)}: {channel_id}")
 
         video_ids = get_recent_video_ids(channel_id, YOUTUBE_API_KEY, published_after)
-        all_video_ids.extend(video_ids)
+        channel_video_ids[channel_id] = video_ids
         print(f"📊 Channel {channel_id} contributed {len(video_ids)} videos")
     
-    print(f"\n✅ STEP 1 COMPLETE: Found {len(all_video_ids)} total videos across all channels")
-    if len(all_video_ids) == 0:
+    total_videos = sum(len(video_ids) for video_ids in channel_video_ids.values())
+    print(f"\n✅ STEP 1 COMPLETE: Found {total_videos} total videos across all channels")
+    if total_videos == 0:
         print("⚠️ WARNING: No videos found - this might indicate API issues or no recent uploads")
     
-    return all_video_ids
+    return channel_video_ids
 
-def summarize_videos(video_ids: list[str], llm_models: list[str]) -> list[str]:
+def summarize_videos(
+    video_ids: list[str],
+    llm_models: list[str],
+    video_channels: dict[str, str] | None = None,
+    archive: ArticleArchive | None = None,
+    video_newsletters: dict[str, list[str]] | None = None
+) -> dict[str, str]:
+    """
+    Fetch and summarize each video, returning articles keyed by video ID.
+    Videos whose transcript or summary fails are left out of the result.
+
+    With an archive, already archived videos are reused without calling the LLM,
+    and every new article is appended to the archive. A story is summarized as a
+    short follow-up only when every newsletter in `video_newsletters` receiving
+    the video already sent an article covering it.
+    """
+    video_channels = video_channels or {}
+    video_newsletters = video_newsletters or {}
+    covered_within_days = ARCHIVE_CONFIG.get("covered_within_days", 7)
     print(f"\n🚀 STEP 2 & 3: Processing {len(video_ids)} videos (transcript + AI summarization)")
     
-    articles = []
+    articles = {}
     transcript_failures = []
     ai_failures = []
     
     for i, video_id in enumerate(video_ids, 1):
         print(f"\n📹 Processing video {i}/{len(video_ids)}: {video_id}")
         
+        archived = archive.get_article(video_id) if archive else None
+        if archived:
+            articles[video_id] = archived["body"]
+            print(f"♻️ STEPS 2 & 3 SKIPPED: Reusing archived article from {archived['created_at']}")
+            continue
+        
         # STEP 2: Transcript fetching
         try:
             print("🌐 STEP 2a: Fetching transcript...")
@@ -90,11 +121,38 @@ def summarize_videos(video_ids: list[str], llm_models: list[str]) -> list[str]:
 
         # STEP 3: AI processing  
         try:
+            previous_coverage = []
+            if archive:
+                covered = archive.find_covered(transcript, video_newsletters.get(video_id, []), covered_within_days)
+                previous_coverage = [row["title"] for row in covered]
+                if previous_coverage:
+                    print(f"🔁 Story covered before in {len(previous_coverage)} article(s) - writing a short follow-up")
+            
             print("🧠 STEP 3: Summarizing transcript with CrewAI agent...")
-            article = run_summary(transcript, llm_models)
-            articles.append(article)
+            result, model_name = run_summary(transcript, llm_models, previous_coverage=previous_coverage)
+            article = str(result).strip()
             print(f"✅ STEP 3 SUCCESS: Generated article for {video_id}")
             
+            if archive:
+                token_usage = getattr(result, "token_usage", None)
+                try:
+                    archive.add_article(
+                        video_id,
+                        article,
+                        channel_id=video_channels.get(video_id),
+                        model=model_name,
+                        token_usage={
+                            "prompt_tokens": getattr(token_usage, "prompt_tokens", None),
+                            "completion_tokens": getattr(token_usage, "completion_tokens", None),
+                            "total_tokens": getattr(token_usage, "total_tokens", None),
+                        },
+                    )
+                except Exception as e:
+                    # The article is still delivered, it just won't be reused or searchable
+                    print(f"⚠️ Could not archive article for {video_id} - {type(e).__name__}: {e}")
+            
+            articles[video_id] = article
+            
             # Add delay between video processing to avoid rate limits
             if i < len(video_ids):  # Don't delay after last video
                 rate_limited_processing_delay(i-1, len(video_ids), 10.0, "Waiting 10 seconds before next video...")
@@ -124,19 +182,28 @@ def summarize_videos(video_ids: list[str], llm_models: list[str]) -> list[str]:
 
     return articles
 
-def deliver_articles(articles: list[str]):
+def deliver_articles(
+    articles: list[str],
+    recipient_email: str | None = None,
+    subject: str = f"📰 {NEWSLETTER_NAME}"
+) -> bool:
+    """
+    Email the articles as one newsletter, or a failure notice when there are none.
+    Returns True only when the newsletter itself was sent.
+    """
+    recipient_email = recipient_email or RECIPIENT_EMAIL
     print(f"\n🚀 STEP 4: Email delivery")
     print(f"📊 Articles to deliver: {len(articles)}")
     
     # Check email configuration
     missing_config = []
-    if not RECIPIENT_EMAIL: missing_config.append("RECIPIENT_EMAIL")
+    if not recipient_email: missing_config.append("RECIPIENT_EMAIL")
     if not SENDER_EMAIL: missing_config.append("SENDER_EMAIL")
     if not SENDER_PASSWORD: missing_config.append("SENDER_PASSWORD")
     
     if missing_config:
         print(f"❌ STEP 4 FAILED: Missing email configuration: {', '.join(missing_config)}")
-        return
+        return False
     
     if not articles:
         # Send a notification email about the failure
@@ -158,11 +225,11 @@ Unfortunately, no articles could be processed today due to processing issues.
 """
         print("⚠️ No articles to send - sending failure notification email")
         try:
-            send_email(failure_message, RECIPIENT_EMAIL, SENDER_EMAIL, SENDER_PASSWORD)
+            send_email(failure_message, recipient_email, SENDER_EMAIL, SENDER_PASSWORD, subject)
             print("✅ STEP 4 SUCCESS: Failure notification email sent successfully")
         except Exception as e:
             print(f"❌ STEP 4 FAILED: Could not send notification email - {type(e).__name__}: {e}")
-        return
+        return False
     
     # Generate final content
     markdown = concatenate_text(articles)
@@ -170,9 +237,10 @@ Unfortunately, no articles could be processed today due to processing issues.
     
     # Send newsletter
     try:
-        print(f"📧 Sending newsletter to {RECIPIENT_EMAIL}...")
-        send_email(markdown, RECIPIENT_EMAIL, SENDER_EMAIL, SENDER_PASSWORD)
+        print(f"📧 Sending newsletter to {recipient_email}...")
+        send_email(markdown, recipient_email, SENDER_EMAIL, SENDER_PASSWORD, subject)
         print(f"✅ STEP 4 SUCCESS: Newsletter delivered successfully")
+        return True
     except Exception as e:
         print(f"❌ STEP 4 FAILED: Email delivery error - {type(e).__name__}: {e}")
         raise
@@ -201,11 +269,14 @@ if __name__ == "__main__":
     print(f"✅ SETUP COMPLETE: Configured for {len(channel_ids)} channels, {days_back} days back")
     
     try:
-        with managed_groq():
+        with managed_groq(), ArticleArchive(ARCHIVE_PATH) as archive:
             # Execute pipeline
-            video_ids = get_video_ids(channel_ids, days_back)
-            articles = summarize_videos(video_ids, llm_models)
-            deliver_articles(articles)
+            channel_video_ids = get_channel_video_ids(channel_ids, days_back)
+            video_channels = {v: c for c, ids in channel_video_ids.items() for v in ids}
+            video_newsletters = {v: [NEWSLETTER_NAME] for v in video_channels}
+            articles = summarize_videos(list(video_channels), llm_models, video_channels, archive, video_newsletters)
+            if deliver_articles(list(articles.values())):
+                archive.add_issue(NEWSLETTER_NAME, list(articles))
         
         print("\n" + "=" * 60)
         print("✅ PIPELINE COMPLETE: YouTube Newsletter successfully processed")
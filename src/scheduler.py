@@ -0,0 +1,164 @@
+import datetime
+import os
+import time
+import yaml
+
+from croniter import croniter
+from main import (
+    APP_CONFIG,
+    ARCHIVE_PATH,
+    YOUTUBE_API_KEY,
+    deliver_articles,
+    get_channel_video_ids,
+    project_root,
+    summarize_videos,
+)
+from tools.article_archive import ArticleArchive
+from tools.groq_tools import managed_groq
+
+# MARK: Loading
+
+newsletters_path = project_root / "config" / "newsletters.yaml"
+with open(newsletters_path, "r") as f:
+    NEWSLETTER_CONFIG = yaml.safe_load(f)
+
+# MARK: Newsletters
+
+def load_newsletters(config: dict, now: datetime.datetime | None = None) -> list[dict]:
+    """
+    Build newsletter definitions from config, each with its next run time.
+    """
+    now = now or datetime.datetime.now()
+    newsletters = []
+
+    for entry in config.get("newsletters", []):
+        name = entry.get("name")
+        schedule = entry.get("schedule")
+        channel_ids = entry.get("youtube_channel_ids", [])
+        recipients = entry.get("recipients") or []
+
+        if not name or not schedule:
+            raise ValueError(f"Newsletter definition requires a name and a schedule: {entry}")
+        if not croniter.is_valid(schedule):
+            raise ValueError(f"Newsletter '{name}' has an invalid cron schedule: {schedule}")
+        if not is_string_list(channel_ids):
+            raise ValueError(f"Newsletter '{name}' youtube_channel_ids must be a list of strings: {channel_ids}")
+        if not channel_ids:
+            raise ValueError(f"Newsletter '{name}' has no YouTube channel IDs.")
+        if not is_string_list(recipients):
+            raise ValueError(f"Newsletter '{name}' recipients must be a list of strings: {recipients}")
+
+        newsletters.append({
+            "name": name,
+            "schedule": schedule,
+            "recipients": recipients,
+            "channel_ids": channel_ids,
+            "next_run": croniter(schedule, now).get_next(datetime.datetime),
+        })
+
+    if not newsletters:
+        raise ValueError("No newsletters defined in configuration.")
+
+    return newsletters
+
+def is_string_list(value) -> bool:
+    return isinstance(value, list) and all(isinstance(item, str) for item in value)
+
+def run_due_newsletters(
+    newsletters: list[dict],
+    days_back: int,
+    llm_models: list[str],
+    archive: ArticleArchive
+):
+    """
+    Fetch the union of channels once, summarize each video once, then deliver
+    each newsletter the articles for its channels. Videos summarized by an
+    earlier run are reused from the archive by summarize_videos, which is what
+    keeps newsletters on different schedules from summarizing a video twice.
+    """
+    print(f"\n🗓️ Running {len(newsletters)} due newsletter(s): {', '.join(n['name'] for n in newsletters)}")
+
+    channel_ids = list(dict.fromkeys(c for n in newsletters for c in n["channel_ids"]))
+    channel_video_ids = get_channel_video_ids(channel_ids, days_back)
+
+    video_channels = {v: c for c, ids in channel_video_ids.items() for v in ids}
+    video_newsletters = {
+        v: [n["name"] for n in newsletters if c in n["channel_ids"]] for v, c in video_channels.items()
+    }
+    articles_by_video = summarize_videos(
+        list(video_channels), llm_models, video_channels, archive, video_newsletters
+    )
+
+    for newsletter in newsletters:
+        newsletter_video_ids = dict.fromkeys(
+            v for c in newsletter["channel_ids"] for v in channel_video_ids.get(c, [])
+        )
+        video_ids = [v for v in newsletter_video_ids if v in articles_by_video]
+
+        print(f"\n📰 Newsletter '{newsletter['name']}': {len(video_ids)} article(s)")
+        try:
+            sent = deliver_articles(
+                [articles_by_video[v] for v in video_ids],
+                ", ".join(newsletter["recipients"]) or None,
+                f"📰 {newsletter['name']}"
+            )
+            if sent:
+                archive.add_issue(newsletter["name"], video_ids)
+        except Exception as e:
+            # Keep delivering the remaining newsletters
+            print(f"❌ Newsletter '{newsletter['name']}' delivery failed: {type(e).__name__}: {e}")
+
+def run_scheduler(
+    newsletters: list[dict],
+    days_back: int,
+    llm_models: list[str],
+    archive: ArticleArchive,
+    poll_interval: float = 60.0
+):
+    for newsletter in newsletters:
+        print(f"📅 '{newsletter['name']}' scheduled for {newsletter['next_run']:%Y-%m-%d %H:%M}")
+
+    while True:
+        now = datetime.datetime.now()
+        due = [n for n in newsletters if n["next_run"] <= now]
+
+        if due:
+            try:
+                run_due_newsletters(due, days_back, llm_models, archive)
+            except Exception as e:
+                print(f"\n❌ SCHEDULED RUN FAILED: {type(e).__name__}: {e}")
+
+            for newsletter in due:
+                newsletter["next_run"] = croniter(newsletter["schedule"], now).get_next(datetime.datetime)
+                print(f"📅 '{newsletter['name']}' next run at {newsletter['next_run']:%Y-%m-%d %H:%M}")
+
+        time.sleep(poll_interval)
+
+# MARK: Entry point
+
+if __name__ == "__main__":
+    print("🚀 Starting YouTube Summary Newsletter Scheduler")
+    print("=" * 60)
+
+    # Validate environment
+    if not YOUTUBE_API_KEY:
+        print("❌ SETUP FAILED: Missing YOUTUBE_API_KEY environment variable")
+        raise EnvironmentError("Please set the YOUTUBE_API_KEY environment variable.")
+
+    if not os.getenv("GROQ_API_KEY"):
+        print("❌ SETUP FAILED: Missing GROQ_API_KEY environment variable")
+        raise EnvironmentError("Please set the GROQ_API_KEY environment variable.")
+
+    # Load configuration
+    days_back = APP_CONFIG.get("video_retrieval", {}).get("published_after_days", 1)
+    llm_models = APP_CONFIG.get("llm", {}).get("models", ["llama-3.1-8b-instant"])
+    poll_interval = NEWSLETTER_CONFIG.get("scheduler", {}).get("poll_interval_seconds", 60)
+    newsletters = load_newsletters(NEWSLETTER_CONFIG)
+
+    print(f"✅ SETUP COMPLETE: Scheduled {len(newsletters)} newsletters, {days_back} days back")
+
+    try:
+        with managed_groq(), ArticleArchive(ARCHIVE_PATH) as archive:
+            run_scheduler(newsletters, days_back, llm_models, archive, poll_interval)
+    except KeyboardInterrupt:
+        print("\n🛑 Scheduler stopped")
@@ -0,0 +1,304 @@
+import datetime
+import math
+import re
+import sqlite3
+from collections import Counter
+from pathlib import Path
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    video_id TEXT NOT NULL,
+    channel_id TEXT,
+    model TEXT,
+    prompt_tokens INTEGER,
+    completion_tokens INTEGER,
+    total_tokens INTEGER,
+    title TEXT NOT NULL,
+    body TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_articles_video_id ON articles(video_id);
+CREATE INDEX IF NOT EXISTS idx_articles_created_at ON articles(created_at);
+
+CREATE TABLE IF NOT EXISTS issues (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    newsletter TEXT NOT NULL,
+    sent_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_issues_newsletter_sent_at ON issues(newsletter, sent_at);
+
+CREATE TABLE IF NOT EXISTS issue_articles (
+    issue_id INTEGER NOT NULL REFERENCES issues(id),
+    position INTEGER NOT NULL,
+    article_id INTEGER NOT NULL REFERENCES articles(id),
+    PRIMARY KEY (issue_id, position)
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, body, content='articles', content_rowid='id'
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_vocab USING fts5vocab(articles_fts, row);
+
+CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+END;
+"""
+
+STOPWORDS = {
+    "about", "actually", "after", "again", "against", "basically", "because", "before",
+    "being", "between", "could", "doesn", "going", "gonna", "kinda", "maybe", "might",
+    "people", "pretty", "really", "right", "should", "something", "their", "there",
+    "these", "thing", "things", "think", "those", "through", "today", "under", "video",
+    "wanna", "where", "which", "while", "would", "years", "youre",
+}
+
+class ArticleArchive:
+    """
+    Append-only SQLite archive of generated articles with an FTS5 index, plus
+    the issues each newsletter sent. Rows are never updated or deleted once written.
+    """
+
+    def __init__(self, db_path: str | Path):
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def add_article(
+        self,
+        video_id: str,
+        body: str,
+        channel_id: str | None = None,
+        model: str | None = None,
+        token_usage: dict | None = None,
+        created_at: datetime.datetime | None = None
+    ) -> int:
+        token_usage = token_usage or {}
+        created_at = created_at or datetime.datetime.now()
+        with self.conn:
+            cursor = self.conn.execute(
+                """
+                INSERT INTO articles (
+                    video_id, channel_id, model, prompt_tokens, completion_tokens,
+                    total_tokens, title, body, created_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    video_id,
+                    channel_id,
+                    model,
+                    token_usage.get("prompt_tokens"),
+                    token_usage.get("completion_tokens"),
+                    token_usage.get("total_tokens"),
+                    extract_title(body),
+                    body,
+                    created_at.isoformat(timespec="seconds"),
+                ),
+            )
+        return cursor.lastrowid
+
+    def get_article(self, video_id: str) -> sqlite3.Row | None:
+        """
+        Latest archived article for a video, or None if it was never summarized.
+        """
+        return self.conn.execute(
+            "SELECT * FROM articles WHERE video_id = ? ORDER BY id DESC LIMIT 1",
+            (video_id,),
+        ).fetchone()
+
+    def add_issue(
+        self,
+        newsletter: str,
+        video_ids: list[str],
+        sent_at: datetime.datetime | None = None
+    ) -> int:
+        """
+        Record a sent issue as the latest archived article of each video, in order.
+        Videos without an archived article are left out.
+        """
+        sent_at = sent_at or datetime.datetime.now()
+        articles = [self.get_article(video_id) for video_id in video_ids]
+        with self.conn:
+            issue_id = self.conn.execute(
+                "INSERT INTO issues (newsletter, sent_at) VALUES (?, ?)",
+                (newsletter, sent_at.isoformat(timespec="seconds")),
+            ).lastrowid
+            self.conn.executemany(
+                "INSERT INTO issue_articles (issue_id, position, article_id) VALUES (?, ?, ?)",
+                [
+                    (issue_id, position, article["id"])
+                    for position, article in enumerate(a for a in articles if a is not None)
+                ],
+            )
+        return issue_id
+
+    def get_issues(
+        self,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        newsletter: str | None = None
+    ) -> list[sqlite3.Row]:
+        """
+        Issues sent in [start, end), optionally for a single newsletter, oldest first.
+        """
+        query = "SELECT * FROM issues WHERE sent_at >= ? AND sent_at < ?"
+        params = [start.isoformat(timespec="seconds"), end.isoformat(timespec="seconds")]
+        if newsletter:
+            query += " AND newsletter = ?"
+            params.append(newsletter)
+        return self.conn.execute(query + " ORDER BY id", params).fetchall()
+
+    def get_issue_articles(self, issue_id: int) -> list[sqlite3.Row]:
+        """
+        Articles of a sent issue, in the order they appeared in the email.
+        """
+        return self.conn.execute(
+            """
+            SELECT articles.* FROM issue_articles
+            JOIN articles ON articles.id = issue_articles.article_id
+            WHERE issue_articles.issue_id = ?
+            ORDER BY issue_articles.position
+            """,
+            (issue_id,),
+        ).fetchall()
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        since: datetime.datetime | None = None,
+        raw: bool = False
+    ) -> list[sqlite3.Row]:
+        """
+        Full-text search, best matches first. By default every word of `query`
+        must appear; with `raw=True` the query uses FTS5 syntax and may raise
+        sqlite3.OperationalError if it is malformed.
+        """
+        if not raw:
+            query = to_fts_query(tokenize(query), "AND")
+            if not query:
+                return []
+
+        since = since or datetime.datetime.min
+        return self.conn.execute(
+            """
+            SELECT articles.* FROM articles_fts
+            JOIN articles ON articles.id = articles_fts.rowid
+            WHERE articles_fts MATCH ? AND articles.created_at >= ?
+            ORDER BY bm25(articles_fts)
+            LIMIT ?
+            """,
+            (query, since.isoformat(timespec="seconds"), limit),
+        ).fetchall()
+
+    def find_covered(
+        self,
+        text: str,
+        newsletters: list[str],
+        within_days: int = 7,
+        min_overlap: float = 0.5,
+        min_matches: int = 3,
+        keyword_count: int = 12
+    ) -> list[sqlite3.Row]:
+        """
+        Sent articles from the last `within_days` that likely cover the same story
+        as `text`. Only articles every one of `newsletters` already sent count, so
+        readers of each newsletter receiving the story have seen the earlier coverage.
+
+        Keywords are the words of `text` that also appear in the archive, ranked by
+        frequency times their rarity across it (BM25-style IDF), so words found in
+        most articles count for little. Words the archive has never seen cannot match
+        any article and are ignored. A candidate counts as covered when it contains
+        at least `min_matches` keywords carrying `min_overlap` of the keyword weight.
+        """
+        total_articles = self.conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+        term_counts = Counter(extract_keywords(text))
+        if not newsletters or not total_articles or not term_counts:
+            return []
+
+        doc_frequencies = self._doc_frequencies(list(term_counts))
+        weights = {
+            term: term_counts[term] * idf(doc_frequency, total_articles)
+            for term, doc_frequency in doc_frequencies.items()
+        }
+        keywords = sorted(weights, key=weights.get, reverse=True)[:keyword_count]
+        if len(keywords) < min_matches:
+            return []
+        total_weight = sum(weights[keyword] for keyword in keywords)
+
+        query = to_fts_query(keywords, "OR")
+        since = datetime.datetime.now() - datetime.timedelta(days=within_days)
+
+        covered = []
+        for row in self._sent_matches(query, sorted(set(newsletters)), since, limit=5):
+            article_words = set(tokenize(f"{row['title']} {row['body']}"))
+            matched = [keyword for keyword in keywords if keyword in article_words]
+            matched_weight = sum(weights[keyword] for keyword in matched)
+            if len(matched) >= min_matches and matched_weight / total_weight >= min_overlap:
+                covered.append(row)
+        return covered
+
+    def _sent_matches(
+        self,
+        query: str,
+        newsletters: list[str],
+        since: datetime.datetime,
+        limit: int
+    ) -> list[sqlite3.Row]:
+        placeholders = ", ".join("?" for _ in newsletters)
+        return self.conn.execute(
+            f"""
+            SELECT articles.* FROM articles_fts
+            JOIN articles ON articles.id = articles_fts.rowid
+            WHERE articles_fts MATCH ? AND articles.id IN (
+                SELECT issue_articles.article_id FROM issue_articles
+                JOIN issues ON issues.id = issue_articles.issue_id
+                WHERE issues.sent_at >= ? AND issues.newsletter IN ({placeholders})
+                GROUP BY issue_articles.article_id
+                HAVING COUNT(DISTINCT issues.newsletter) = ?
+            )
+            ORDER BY bm25(articles_fts)
+            LIMIT ?
+            """,
+            (query, since.isoformat(timespec="seconds"), *newsletters, len(newsletters), limit),
+        ).fetchall()
+
+    def _doc_frequencies(self, terms: list[str]) -> dict[str, int]:
+        placeholders = ", ".join("?" for _ in terms)
+        rows = self.conn.execute(
+            f"SELECT term, doc FROM articles_vocab WHERE term IN ({placeholders}) AND doc > 0",
+            terms,
+        ).fetchall()
+        return {row["term"]: row["doc"] for row in rows}
+
+def tokenize(text: str) -> list[str]:
+    return re.findall(r"[a-z0-9]+", text.lower())
+
+def to_fts_query(terms: list[str], operator: str) -> str:
+    """
+    Join terms into an FTS5 query, quoting each so punctuation is never parsed as syntax.
+    """
+    return f" {operator} ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
+def extract_keywords(text: str) -> list[str]:
+    return [w for w in tokenize(text) if len(w) >= 5 and not w.isdigit() and w not in STOPWORDS]
+
+def idf(doc_frequency: int, total_articles: int) -> float:
+    return math.log((total_articles - doc_frequency + 0.5) / (doc_frequency + 0.5) + 1)
+
+def extract_title(markdown_text: str) -> str:
+    for line in markdown_text.splitlines():
+        if line.strip():
+            return line.strip().lstrip("#").strip()
+    return ""
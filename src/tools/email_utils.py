@@ -7,7 +7,8 @@ def send_email(
     markdown_text: str,
     recipient_email: str,
     sender_email: str,
-    sender_password: str
+    sender_password: str,
+    subject: str = "📰 TLDR News Daily Summary"
 ):
     try:
         html = markdown2.markdown(markdown_text, extras=[
@@ -15,7 +16,7 @@ def send_email(
         ])
 
         msg = MIMEMultipart("alternative")
-        msg["Subject"] = "📰 TLDR News Daily Summary"
+        msg["Subject"] = subject
         msg["From"] = sender_email
         msg["To"] = recipient_email
 
@@ -0,0 +1,154 @@
+import datetime
+import pytest
+import sqlite3
+
+from tools.article_archive import ArticleArchive
+
+@pytest.fixture
+def archive(tmp_path):
+    with ArticleArchive(tmp_path / "articles.db") as archive:
+        yield archive
+
+def test_search_treats_punctuation_as_plain_words(archive):
+    archive.add_article("v1", "# U.S. election\n\nThe U.S. election and trump-tariffs don't mix.")
+
+    for query in ["U.S. election", "don't", "trump-tariffs"]:
+        assert [row["video_id"] for row in archive.search(query)] == ["v1"]
+
+    assert archive.search("election budget") == []
+
+def test_raw_search_raises_on_invalid_fts_syntax(archive):
+    with pytest.raises(sqlite3.OperationalError):
+        archive.search("U.S. election", raw=True)
+
+def add_common_news_articles(archive):
+    for i, topic in enumerate(["housing", "railways", "farming", "schools", "energy"]):
+        archive.add_article(
+            f"common{i}",
+            f"# {topic.title()} plans\n\nThe government told people the country "
+            f"needs {topic} reform within years, ministers said in parliament.",
+        )
+    archive.add_issue("Global", [f"common{i}" for i in range(5)])
+
+def test_find_covered_ignores_words_common_to_most_articles(archive):
+    add_common_news_articles(archive)
+
+    transcript = "the government says people in the country waited years " * 5 + "for hospital waiting lists"
+    assert archive.find_covered(transcript, ["Global"]) == []
+
+def test_find_covered_matches_follow_up_story(archive):
+    add_common_news_articles(archive)
+    archive.add_article(
+        "budget",
+        "# Reeves budget freezes thresholds\n\nChancellor Reeves froze income thresholds "
+        "in the autumn budget, and the government told people it was needed.",
+    )
+    archive.add_issue("Global", ["budget"])
+
+    transcript = (
+        "chancellor reeves is back defending the autumn budget after the threshold freeze "
+        "the government says reeves budget thresholds chancellor income"
+    )
+    assert [row["video_id"] for row in archive.find_covered(transcript, ["Global"])] == ["budget"]
+
+NEWS_ARTICLES = {
+    "nhs": "# NHS waiting lists hit record\n\nHospital waiting lists in England reached a new high, "
+           "with the government blaming strikes and winter pressures on the health service.",
+    "rail": "# Rail fares rise again\n\nTrain operators confirmed another fare increase, and "
+            "commuters face higher costs as the government reviews rail franchises.",
+    "tariffs": "# US tariffs rattle European exporters\n\nThe White House announced new tariffs on "
+               "European steel, and EU officials promised a measured response to protect jobs.",
+    "election": "# German election campaign heats up\n\nParties clashed over migration and the economy "
+                "as voters prepare for a snap election in February.",
+    "housing": "# Housing targets under pressure\n\nCouncils warned the government that housing targets "
+               "are unrealistic without more funding for infrastructure and planners.",
+    "ukraine": "# Ukraine ceasefire talks stall\n\nNegotiators failed to agree on a ceasefire as "
+               "fighting continued along the eastern front lines.",
+    "climate": "# Climate summit ends in compromise\n\nCountries agreed a watered-down deal on climate "
+               "finance after two weeks of tense negotiations.",
+    "schools": "# Teachers accept pay offer\n\nUnions voted to accept the government's pay offer, "
+               "ending months of disruption in schools across the country.",
+    "energy": "# Energy price cap to fall\n\nOfgem said the energy price cap will fall in spring, "
+              "easing bills for millions of households.",
+    "water": "# Water companies fined over sewage\n\nRegulators fined water companies for sewage spills "
+             "and ordered investment in ageing pipes.",
+    "france": "# French government survives confidence vote\n\nThe prime minister narrowly survived a "
+              "confidence vote over the pension reform budget.",
+    "china": "# China growth slows\n\nOfficial figures showed growth slowing as exports weakened and "
+             "the property crisis deepened.",
+    "farming": "# Farmers protest inheritance tax\n\nTractors blocked Westminster as farmers protested "
+               "changes to inheritance tax relief on agricultural land.",
+    "ai": "# AI safety bill published\n\nThe government published a bill setting safety rules for "
+          "advanced artificial intelligence models.",
+    "migration": "# Channel crossings rise\n\nSmall boat crossings rose compared with last year, "
+                 "putting pressure on the home secretary.",
+}
+
+BUDGET_ARTICLE = (
+    "# Reeves budget freezes income tax thresholds\n\nChancellor Rachel Reeves froze income tax "
+    "thresholds until 2028 in the autumn budget, pulling more workers into higher bands. "
+    "The Treasury says the freeze raises billions for public services."
+)
+
+BUDGET_FALLOUT_TRANSCRIPT = (
+    "so a week on from the autumn budget and the row over the threshold freeze just will not go away. "
+    "the chancellor is insisting that keeping the income tax bands frozen was the only responsible choice, "
+    "but economists reckon that means twenty percent more workers get dragged into the higher rate. "
+    "labour backbenchers are furious, they say the budget delivered the opposite of what was promised, "
+    "and the treasury is now briefing that the freeze could be reviewed before 2028. "
+    "reeves herself told reporters that workers would be better off in the long run."
+)
+
+def add_realistic_archive(archive, newsletter="Global"):
+    for video_id, body in NEWS_ARTICLES.items():
+        archive.add_article(video_id, body)
+    archive.add_article("budget", BUDGET_ARTICLE)
+    archive.add_issue(newsletter, [*NEWS_ARTICLES, "budget"])
+
+def test_find_covered_matches_follow_up_worded_differently_from_article(archive):
+    add_realistic_archive(archive)
+
+    assert [row["video_id"] for row in archive.find_covered(BUDGET_FALLOUT_TRANSCRIPT, ["Global"])] == ["budget"]
+
+def test_find_covered_with_a_single_archived_article(archive):
+    archive.add_article("budget", BUDGET_ARTICLE)
+    archive.add_issue("Global", ["budget"])
+
+    assert [row["video_id"] for row in archive.find_covered(BUDGET_FALLOUT_TRANSCRIPT, ["Global"])] == ["budget"]
+
+def test_find_covered_ignores_articles_not_sent_to_every_receiving_newsletter(archive):
+    add_realistic_archive(archive, newsletter="Global")
+    archive.add_article("unsent", BUDGET_ARTICLE)
+
+    assert archive.find_covered(BUDGET_FALLOUT_TRANSCRIPT, ["Europe"]) == []
+    assert archive.find_covered(BUDGET_FALLOUT_TRANSCRIPT, ["Global", "Europe"]) == []
+
+    archive.add_issue("Europe", ["budget"])
+    assert [row["video_id"] for row in archive.find_covered(BUDGET_FALLOUT_TRANSCRIPT, ["Global", "Europe"])] == ["budget"]
+
+def test_find_covered_ignores_unrelated_story_in_realistic_archive(archive):
+    add_realistic_archive(archive)
+
+    transcript = (
+        "the government says the country is finally back in the space race after the first rocket "
+        "launch from the scottish spaceport. ministers claim thousands of workers will follow, but "
+        "critics question whether the satellite industry can compete with american launch companies."
+    )
+    assert archive.find_covered(transcript, ["Global"]) == []
+
+def test_issues_record_what_each_newsletter_sent(archive):
+    earlier = datetime.datetime(2025, 1, 30, 6, 0)
+    today = datetime.datetime(2025, 1, 31, 6, 0)
+    archive.add_article("shared", "# Shared story", created_at=earlier)
+    archive.add_article("global", "# Global story", created_at=today)
+    archive.add_article("eu", "# EU story", created_at=today)
+
+    archive.add_issue("Global", ["global", "shared"], sent_at=today)
+    archive.add_issue("Europe", ["shared", "eu", "missing"], sent_at=today)
+
+    issues = archive.get_issues(datetime.datetime(2025, 1, 31), datetime.datetime(2025, 2, 1), "Europe")
+    assert [issue["newsletter"] for issue in issues] == ["Europe"]
+    assert [row["video_id"] for row in archive.get_issue_articles(issues[0]["id"])] == ["shared", "eu"]
+
+    all_issues = archive.get_issues(datetime.datetime(2025, 1, 31), datetime.datetime(2025, 2, 1))
+    assert [issue["newsletter"] for issue in all_issues] == ["Global", "Europe"]
@@ -0,0 +1,65 @@
+import main
+import pytest
+
+from tools.article_archive import ArticleArchive
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+class CrewResult:
+    def __init__(self, text):
+        self.text = text
+        self.token_usage = SimpleNamespace(prompt_tokens=120, completion_tokens=30, total_tokens=150)
+
+    def __str__(self):
+        return self.text
+
+@pytest.fixture
+def archive(tmp_path):
+    with ArticleArchive(tmp_path / "articles.db") as archive:
+        yield archive
+
+def summarize(video_ids, archive, **kwargs):
+    with patch.object(main, "get_transcript", side_effect=lambda v: f"transcript of {v}"), \
+         patch.object(main, "run_summary",
+                      return_value=(CrewResult("# Fresh article\n\n"), "llama-3.3-70b-versatile")) as summary, \
+         patch.object(main, "rate_limited_processing_delay") as delay:
+        articles = main.summarize_videos(video_ids, ["llama-3.3-70b-versatile"], archive=archive, **kwargs)
+    return articles, summary, delay
+
+def test_archived_videos_are_reused_without_calling_the_llm(archive):
+    archive.add_article("v1", "# Archived article")
+
+    articles, summary, _ = summarize(["v1"], archive)
+
+    assert articles == {"v1": "# Archived article"}
+    summary.assert_not_called()
+
+def test_new_articles_are_archived_with_channel_model_and_tokens(archive):
+    articles, _, _ = summarize(["v1"], archive, video_channels={"v1": "UCchannel"})
+
+    row = archive.get_article("v1")
+    assert articles == {"v1": "# Fresh article"}
+    assert (row["channel_id"], row["model"]) == ("UCchannel", "llama-3.3-70b-versatile")
+    assert (row["prompt_tokens"], row["completion_tokens"], row["total_tokens"]) == (120, 30, 150)
+
+def test_covered_stories_pass_previous_headlines_to_the_follow_up_prompt():
+    archive = MagicMock()
+    archive.get_article.return_value = None
+    archive.find_covered.return_value = [{"title": "Reeves budget freezes thresholds"}]
+
+    _, summary, _ = summarize(["v1"], archive, video_newsletters={"v1": ["Global"]})
+
+    assert archive.find_covered.call_args.args[:2] == ("transcript of v1", ["Global"])
+    assert summary.call_args.kwargs["previous_coverage"] == ["Reeves budget freezes thresholds"]
+
+def test_archive_write_failure_still_delivers_and_rate_limits():
+    archive = MagicMock()
+    archive.get_article.return_value = None
+    archive.find_covered.return_value = []
+    archive.add_article.side_effect = RuntimeError("disk full")
+
+    articles, summary, delay = summarize(["v1", "v2"], archive)
+
+    assert articles == {"v1": "# Fresh article", "v2": "# Fresh article"}
+    assert summary.call_count == 2
+    delay.assert_called_once()
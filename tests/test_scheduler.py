@@ -0,0 +1,94 @@
+import datetime
+import main
+import pytest
+import scheduler
+
+from tools.article_archive import ArticleArchive
+from unittest.mock import MagicMock, patch
+
+NOW = datetime.datetime(2025, 1, 31, 6, 0)
+
+def make_newsletters():
+    return scheduler.load_newsletters({
+        "newsletters": [
+            {"name": "Global", "schedule": "0 6 * * *", "recipients": ["global@example.com"],
+             "youtube_channel_ids": ["global", "daily"]},
+            {"name": "Europe", "schedule": "0 6 * * *", "recipients": ["eu@example.com"],
+             "youtube_channel_ids": ["eu", "daily"]},
+        ]
+    }, now=NOW)
+
+def run(newsletters, archive=None):
+    archive = archive or MagicMock()
+    channel_video_ids = {"global": ["g1"], "eu": ["e1"], "daily": ["d1", "d2"]}
+    with patch.object(scheduler, "get_channel_video_ids", return_value=channel_video_ids) as get_videos, \
+         patch.object(scheduler, "summarize_videos",
+                      side_effect=lambda ids, *args: {v: f"article {v}" for v in ids}) as summarize, \
+         patch.object(scheduler, "deliver_articles") as deliver:
+        scheduler.run_due_newsletters(newsletters, 1, ["model"], archive)
+    return get_videos, summarize, deliver
+
+def test_shared_channels_are_fetched_and_summarized_once():
+    get_videos, summarize, _ = run(make_newsletters())
+
+    get_videos.assert_called_once_with(["global", "daily", "eu"], 1)
+    summarize.assert_called_once()
+    assert sorted(summarize.call_args.args[0]) == ["d1", "d2", "e1", "g1"]
+
+def test_each_newsletter_gets_only_its_channels_articles():
+    _, _, deliver = run(make_newsletters())
+
+    delivered = {call.args[2]: (call.args[0], call.args[1]) for call in deliver.call_args_list}
+    assert delivered == {
+        "📰 Global": (["article g1", "article d1", "article d2"], "global@example.com"),
+        "📰 Europe": (["article e1", "article d1", "article d2"], "eu@example.com"),
+    }
+
+def test_archive_is_used_for_reuse_and_records_each_sent_issue():
+    archive = MagicMock()
+    _, summarize, _ = run(make_newsletters(), archive)
+
+    assert summarize.call_args.args[3] is archive
+    assert summarize.call_args.args[4] == {
+        "g1": ["Global"], "e1": ["Europe"], "d1": ["Global", "Europe"], "d2": ["Global", "Europe"],
+    }
+    assert [call.args for call in archive.add_issue.call_args_list] == [
+        ("Global", ["g1", "d1", "d2"]),
+        ("Europe", ["e1", "d1", "d2"]),
+    ]
+
+def test_newsletters_on_different_schedules_share_archived_articles(tmp_path):
+    channel_video_ids = {"global": ["g1"], "eu": ["e1"], "daily": ["d1", "d2"]}
+    global_newsletter, europe_newsletter = make_newsletters()
+
+    with ArticleArchive(tmp_path / "articles.db") as archive, \
+         patch.object(scheduler, "get_channel_video_ids",
+                      side_effect=lambda ids, days: {c: channel_video_ids[c] for c in ids}), \
+         patch.object(main, "get_transcript", side_effect=lambda v: f"transcript of {v}"), \
+         patch.object(main, "run_summary",
+                      side_effect=lambda t, *args, **kwargs: (f"# Article {t.split()[-1]}", "model")) as summary, \
+         patch.object(main, "rate_limited_processing_delay"), \
+         patch.object(scheduler, "deliver_articles", return_value=True) as deliver:
+        scheduler.run_due_newsletters([global_newsletter], 1, ["model"], archive)
+        scheduler.run_due_newsletters([europe_newsletter], 1, ["model"], archive)
+
+    summarized = [call.args[0].split()[-1] for call in summary.call_args_list]
+    assert sorted(summarized) == ["d1", "d2", "e1", "g1"]
+    assert deliver.call_args_list[1].args[0] == ["# Article e1", "# Article d1", "# Article d2"]
+
+def test_load_newsletters_computes_next_run():
+    assert make_newsletters()[0]["next_run"] == datetime.datetime(2025, 2, 1, 6, 0)
+
+@pytest.mark.parametrize("entry", [
+    {"name": "Bad cron", "schedule": "every morning", "youtube_channel_ids": ["global"]},
+    {"name": "No channels", "schedule": "0 6 * * *", "youtube_channel_ids": []},
+    {"schedule": "0 6 * * *", "youtube_channel_ids": ["global"]},
+    {"name": "String channel", "schedule": "0 6 * * *", "youtube_channel_ids": "UCabc"},
+    {"name": "String recipient", "schedule": "0 6 * * *", "youtube_channel_ids": ["global"],
+     "recipients": "a@example.com"},
+    {"name": "Numeric recipient", "schedule": "0 6 * * *", "youtube_channel_ids": ["global"],
+     "recipients": [42]},
+])
+def test_load_newsletters_rejects_invalid_definitions(entry):
+    with pytest.raises(ValueError):
+        scheduler.load_newsletters({"newsletters": [entry]}, now=NOW)